@@ -0,0 +1,39 @@
+"""index impact.solution_id
+
+Revision ID: 038109f6b769
+Revises: 28b692db0508
+Create Date: 2026-10-16 09:12:41.508213+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '038109f6b769'
+down_revision = '28b692db0508'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction, and keeps impact writable while
+    # the index builds. It's the only step here, so a failed build leaves nothing
+    # else half-applied: drop the INVALID index and re-run
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_impact_solution_id'),
+            'impact',
+            ['solution_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_impact_solution_id'),
+            table_name='impact',
+            postgresql_concurrently=True,
+        )
@@ -1,11 +1,11 @@
-from nbsapi import models
+from nbsapi.schemas.user import AuthenticatedUser
 
 from .user import CurrentUserDep
 
 
 async def validate_is_authenticated(
     current_user: CurrentUserDep,
-) -> models.User:
+) -> AuthenticatedUser:
     """
     This just returns as the CurrentUserDep dependency already throws if there is an issue with the auth token.
     """
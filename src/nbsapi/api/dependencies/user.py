@@ -1,25 +1,57 @@
+import hashlib
+import time
 from typing import Annotated
 
+from cachetools import TLRUCache, TTLCache
 from fastapi import Depends, HTTPException, status
 from jwt import PyJWTError
 
-from nbsapi import models
 from nbsapi.api.dependencies.core import DBSessionDep
 from nbsapi.crud.user import get_user_by_username
 from nbsapi.schemas.auth import TokenData
+from nbsapi.schemas.user import AuthenticatedUser
 from nbsapi.utils.auth import decode_jwt, oauth2_scheme
 
+TOKEN_CACHE_TTL = 30
+# no endpoint edits or deletes users, so there's nothing to invalidate on: this bounds
+# how long a user removed or changed directly in the database stays authenticated
+USER_CACHE_TTL = 10
+
+
+def _token_ttu(_key, payload: dict, now: float) -> float:
+    """Expire cached payloads after TOKEN_CACHE_TTL seconds, or sooner if the token itself expires"""
+    return min(now + TOKEN_CACHE_TTL, payload.get("exp", now))
+
+
+# keyed on the token's SHA-256 digest so we don't hold on to raw bearer tokens
+_token_cache = TLRUCache(maxsize=10_000, ttu=_token_ttu, timer=time.time)
+
+
+def _decode_cached(token: str) -> dict:
+    """Decode a JWT, reusing the verified payload if we've seen the token recently"""
+    key = hashlib.sha256(token.encode()).digest()
+    try:
+        return _token_cache[key]
+    except KeyError:
+        payload = decode_jwt(token)
+        _token_cache[key] = payload
+        return payload
+
+
+# immutable snapshots rather than ORM instances, which any request could mutate
+_user_cache = TTLCache(maxsize=5_000, ttl=USER_CACHE_TTL)
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)], db_session: DBSessionDep
-) -> models.User:
+) -> AuthenticatedUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = decode_jwt(token)
+        payload = _decode_cached(token)
         email = payload.get("sub")
         if email is None:
             raise credentials_exception
@@ -27,10 +59,14 @@ async def get_current_user(
         token_data = TokenData(email=email, permissions=permissions)
     except PyJWTError as e:
         raise credentials_exception
-    user = await get_user_by_username(db_session, token_data.email)
+    user = _user_cache.get(token_data.email)
     if user is None:
-        raise credentials_exception
+        db_user = await get_user_by_username(db_session, token_data.email)
+        if db_user is None:
+            raise credentials_exception
+        user = AuthenticatedUser.model_validate(db_user)
+        _user_cache[token_data.email] = user
     return user
 
 
-CurrentUserDep = Annotated[models.User, Depends(get_current_user)]
+CurrentUserDep = Annotated[AuthenticatedUser, Depends(get_current_user)]
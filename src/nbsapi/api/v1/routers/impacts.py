@@ -1,7 +1,12 @@
 # from nbsapi.api.dependencies.auth import validate_is_authenticated
+import hashlib
 from typing import List
 
-from fastapi import APIRouter, Depends
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from typing_extensions import Annotated
 
 from nbsapi.api.dependencies.auth import validate_is_authenticated
 from nbsapi.api.dependencies.core import DBSessionDep
@@ -20,19 +25,84 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+LOOKUP_CACHE_TTL = 60
+MAX_PAGE_SIZE = 1000
 
-@router.get("/impacts", response_model=List[ImpactBase])
-async def read_impacts(db_session: DBSessionDep):
-    """Retrieve all available adaptation impacts"""
-    targets = await get_impacts(db_session)
-    return targets
+impacts_adapter = TypeAdapter(List[ImpactBase])
+intensities_adapter = TypeAdapter(List[ImpactIntensity])
+units_adapter = TypeAdapter(List[ImpactUnit])
 
+# serialised pages of the lookup tables and their ETags, keyed by (table, offset, limit)
+# and dropped whenever a new entry is written to that table
+_lookup_cache = TTLCache(maxsize=32, ttl=LOOKUP_CACHE_TTL)
 
-@router.get("/impact_intensities", response_model=List[ImpactIntensity])
-async def read_impact_intensity(db_session: DBSessionDep):
-    """Retrieve all available adaptation impact intensities"""
-    targets = await get_impact_intensities(db_session)
-    return targets
+Offset = Annotated[int, Query(ge=0, description="Number of entries to skip")]
+Limit = Annotated[
+    int, Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of entries to return")
+]
+
+
+def _invalidate(table: str):
+    for key in [key for key in list(_lookup_cache) if key[0] == table]:
+        _lookup_cache.pop(key, None)
+
+
+def _with_etag(payload: bytes) -> tuple[bytes, str]:
+    return payload, f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Compare an If-None-Match header against our ETag, as RFC 9110 prescribes
+
+    `*` matches any current representation, and the comparison is weak, so a `W/`
+    prefix on either tag is ignored
+    """
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in (
+        tag.removeprefix("W/") for tag in tags
+    )
+
+
+def conditional_response(request: Request, payload: bytes, etag: str) -> Response:
+    """Answer with 304 Not Modified if the client already holds this payload"""
+    # no-cache: clients may keep the payload, but must revalidate it on every read
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+@router.get(
+    "/impacts",
+    responses={200: {"model": List[ImpactBase]}},
+)
+async def read_impacts(
+    db_session: DBSessionDep, offset: Offset = 0, limit: Limit = 100
+):
+    """Retrieve available adaptation impacts, one page at a time"""
+    targets = await get_impacts(db_session, offset, limit)
+    # get_impacts builds these from typed columns, so serialise without validating
+    return Response(
+        content=impacts_adapter.dump_json(targets), media_type="application/json"
+    )
+
+
+@router.get(
+    "/impact_intensities",
+    responses={200: {"model": List[ImpactIntensity]}},
+)
+async def read_impact_intensity(
+    request: Request, db_session: DBSessionDep, offset: Offset = 0, limit: Limit = 100
+):
+    """Retrieve available adaptation impact intensities, one page at a time"""
+    key = ("intensities", offset, limit)
+    cached = _lookup_cache.get(key)
+    if cached is None:
+        targets = await get_impact_intensities(db_session, offset, limit)
+        cached = _with_etag(intensities_adapter.dump_json(targets))
+        _lookup_cache[key] = cached
+    return conditional_response(request, *cached)
 
 
 @router.post(
@@ -43,14 +113,25 @@ async def read_impact_intensity(db_session: DBSessionDep):
 async def write_impact_intensity(db_session: DBSessionDep, intensity: ImpactIntensity):
     """Create a new impact intensity measure"""
     targets = await create_impact_intensity(db_session, intensity)
+    _invalidate("intensities")
     return targets
 
 
-@router.get("/impact_units", response_model=List[ImpactUnit])
-async def read_impact_unit(db_session: DBSessionDep):
-    """Retrieve all available adaptation impact units"""
-    target = await get_impact_units(db_session)
-    return target
+@router.get(
+    "/impact_units",
+    responses={200: {"model": List[ImpactUnit]}},
+)
+async def read_impact_unit(
+    request: Request, db_session: DBSessionDep, offset: Offset = 0, limit: Limit = 100
+):
+    """Retrieve available adaptation impact units, one page at a time"""
+    key = ("units", offset, limit)
+    cached = _lookup_cache.get(key)
+    if cached is None:
+        target = await get_impact_units(db_session, offset, limit)
+        cached = _with_etag(units_adapter.dump_json(target))
+        _lookup_cache[key] = cached
+    return conditional_response(request, *cached)
 
 
 @router.post(
@@ -61,4 +142,5 @@ async def read_impact_unit(db_session: DBSessionDep):
 async def write_impact_unit(db_session: DBSessionDep, unit: ImpactUnit):
     """Create a new impact intensity unit"""
     target = await create_impact_unit(db_session, unit)
+    _invalidate("units")
     return target
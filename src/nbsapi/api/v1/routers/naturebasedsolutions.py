@@ -1,9 +1,12 @@
 # from nbsapi.api.dependencies.auth import validate_is_authenticated
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Body, Depends
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from cachetools import TTLCache
+from fastapi import APIRouter, Body, Depends, Query
+from fastapi.responses import Response
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import Annotated
 
 from nbsapi.api.dependencies.auth import validate_is_authenticated
 from nbsapi.api.dependencies.core import DBSessionDep
@@ -11,6 +14,7 @@ from nbsapi.crud.naturebasedsolution import (
     create_nature_based_solution,
     get_filtered_solutions,
     get_solution,
+    get_solutions_by_id,
 )
 from nbsapi.schemas.adaptationtarget import AdaptationTargetRead
 from nbsapi.schemas.impact import ImpactIntensity
@@ -18,6 +22,22 @@ from nbsapi.schemas.naturebasedsolution import (
     NatureBasedSolutionCreate,
     NatureBasedSolutionRead,
 )
+from nbsapi.utils.geo import AREA_TOLERANCE, bbox_area
+
+MAX_BBOX_AREA = 1.0  # sq km
+MAX_BATCH_SIZE = 100
+MAX_PAGE_SIZE = 1000
+SOLUTIONS_CACHE_TTL = 60
+
+# built once: dump_json writes bytes straight from pydantic-core
+solution_adapter = TypeAdapter(NatureBasedSolutionRead)
+solutions_adapter = TypeAdapter(List[NatureBasedSolutionRead])
+
+# serialised pages of the unfiltered listing, dropped whenever a solution is written
+_solutions_cache = TTLCache(maxsize=16, ttl=SOLUTIONS_CACHE_TTL)
+# serialised solutions by ID. Solutions are never modified once written, and unknown
+# IDs raise before anything is cached, so entries only need to age out
+_solution_cache = TTLCache(maxsize=1024, ttl=SOLUTIONS_CACHE_TTL)
 
 router = APIRouter(
     prefix="/api/solutions",
@@ -26,11 +46,67 @@ router = APIRouter(
 )
 
 
-@router.get("/solutions/{solution_id}", response_model=NatureBasedSolutionRead)
+def json_response(content: bytes) -> Response:
+    """
+    Send JSON that was serialised by pydantic-core
+
+    Handlers in this router return these directly, so FastAPI neither runs the result
+    through jsonable_encoder nor validates it against a response_model again. Their
+    response schemas are documented using `responses` instead
+    """
+    return Response(content=content, media_type="application/json")
+
+
+@router.get(
+    "/solutions/{solution_id}",
+    responses={200: {"model": NatureBasedSolutionRead}},
+)
 async def read_nature_based_solution(solution_id: int, db_session: DBSessionDep):
     """Retrieve a nature-based solution using its ID"""
-    solution = await get_solution(db_session, solution_id)
-    return solution
+    payload = _solution_cache.get(solution_id)
+    if payload is None:
+        solution = await get_solution(db_session, solution_id)
+        payload = solution_adapter.dump_json(solution, by_alias=True)
+        _solution_cache[solution_id] = payload
+    return json_response(payload)
+
+
+@router.post(
+    "/solutions/batch",
+    responses={200: {"model": List[NatureBasedSolutionRead]}},
+)
+async def read_nature_based_solutions(
+    db_session: DBSessionDep,
+    solution_ids: List[int] = Body(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="IDs of the solutions to retrieve, at most 100",
+        examples=[[1, 2, 3]],
+    ),
+):
+    """Retrieve several nature-based solutions using their IDs. Unknown IDs are skipped"""
+    solutions = await get_solutions_by_id(db_session, solution_ids)
+    return json_response(solutions_adapter.dump_json(solutions, by_alias=True))
+
+
+def check_bbox_area(bbox):
+    """
+    Reject clearly oversized bounding boxes before they can reach the database
+
+    Boxes within the tolerance of the limit are left for PostGIS to measure exactly
+    """
+    if bbox_area(*bbox) > MAX_BBOX_AREA * (1 + AREA_TOLERANCE):
+        raise ValueError("Bounding box area must not exceed 1 sq km")
+    return bbox
+
+
+Longitude = Annotated[float, Field(ge=-180, le=180)]
+Latitude = Annotated[float, Field(ge=-90, le=90)]
+# [west, south, east, north], range-checked by pydantic-core rather than in Python
+BBox = Annotated[
+    Tuple[Longitude, Latitude, Longitude, Latitude], AfterValidator(check_bbox_area)
+]
 
 
 # Define a schema for the request body
@@ -52,42 +128,28 @@ class SolutionRequest(BaseModel):
     intensities: Optional[List["ImpactIntensity"]] = Body(
         None, description="List of impact intensities to filter by"
     )
-    bbox: Optional[List[float]] = Field(
+    bbox: Optional[BBox] = Field(
         None,
         description="Bounding box specified as [west, south, east, north]. The list should contain exactly four float values. Max 1 sq km",
-        min_length=4,
-        max_length=4,
     )
 
-    @model_validator(mode="before")
-    def check_bbox(cls, values):
-        bbox = values.get("bbox")
-        if bbox:
-            if len(bbox) != 4:
-                raise ValueError(
-                    "Bounding box must contain exactly 4 float values: [west, south, east, north]"
-                )
-            west, south, east, north = bbox
-            # Validate the geographic ranges
-            if not (-180 <= west <= 180):
-                raise ValueError("West value must be between -180 and 180 degrees")
-            if not (-90 <= south <= 90):
-                raise ValueError("South value must be between -90 and 90 degrees")
-            if not (-180 <= east <= 180):
-                raise ValueError("East value must be between -180 and 180 degrees")
-            if not (-90 <= north <= 90):
-                raise ValueError("North value must be between -90 and 90 degrees")
-        return values
-
 
 # Route definition
 @router.post(
     "/solutions",
-    response_model=List[NatureBasedSolutionRead],
+    responses={200: {"model": List[NatureBasedSolutionRead]}},
 )
 async def get_solutions(
     db_session: DBSessionDep,
     request_body: Optional[SolutionRequest] = Body(None),
+    index_only: bool = Query(
+        False,
+        description="Only compare bounding boxes when filtering by `bbox`. This is faster, but may also return solutions lying close to the bbox",
+    ),
+    limit: int = Query(
+        100, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of solutions to return"
+    ),
+    offset: int = Query(0, ge=0, description="Number of solutions to skip"),
 ):
     """
     Return a list of nature-based solutions using _optional_ filter criteria:
@@ -96,17 +158,28 @@ async def get_solutions(
     - `bbox`: An array of 4 EPSG 4326 coordinates: `[xmin, ymin, xmax, ymax]` / `[west, south, east, north]` Only solutions intersected by the bbox will be returned. It must be **<=** 1 km sq
     - `intensity`: An array of one or more **adaptation intensities**
 
+    Solutions are returned in ID order, one page at a time: use `limit` and `offset` to page through them
+
     """
     targets = request_body.targets if request_body else None
     bbox = request_body.bbox if request_body else None
     intensities = request_body.intensities if request_body else None
-    solutions = await get_filtered_solutions(db_session, targets, bbox, intensities)
-    return solutions
+    unfiltered = not (targets or bbox or intensities)
+    cached = _solutions_cache.get((limit, offset)) if unfiltered else None
+    if cached is not None:
+        return json_response(cached)
+    solutions = await get_filtered_solutions(
+        db_session, targets, bbox, intensities, index_only, limit, offset
+    )
+    payload = solutions_adapter.dump_json(solutions, by_alias=True)
+    if unfiltered:
+        _solutions_cache[(limit, offset)] = payload
+    return json_response(payload)
 
 
 @router.post(
     "/add_solution/",
-    response_model=NatureBasedSolutionRead,
+    responses={200: {"model": NatureBasedSolutionRead}},
     dependencies=[Depends(validate_is_authenticated)],
 )
 async def write_nature_based_solution(
@@ -118,4 +191,5 @@ async def write_nature_based_solution(
 
     """
     solution = await create_nature_based_solution(db_session, solution)
-    return solution
+    _solutions_cache.clear()
+    return json_response(solution_adapter.dump_json(solution, by_alias=True))
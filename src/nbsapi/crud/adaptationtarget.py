@@ -9,21 +9,20 @@ from nbsapi.schemas.adaptationtarget import TargetBase
 
 async def get_target(db_session: AsyncSession, target_id: int):
     """Retrieve an individual adaptation target"""
-    target = (
-        await db_session.scalars(
-            select(AdaptationTarget).where(AdaptationTarget.id == target_id)
-        )
-    ).first()
-    if not target:
+    target = await db_session.scalar(
+        select(AdaptationTarget.target).where(AdaptationTarget.id == target_id)
+    )
+    if target is None:
         raise HTTPException(status_code=404, detail="Adaptation target not found")
-    actual = TargetBase(id=target.id, type=target.target)
+    actual = TargetBase.model_construct(type=target)
     return actual
 
 
 async def get_targets(db_session: AsyncSession):
     """Retrieve all available adaptation targets"""
-    targets = (await db_session.scalars(select(AdaptationTarget))).unique()
-    actual = [TargetBase(id=target.id, type=target.target) for target in targets]
+    # only the target names are returned, so don't load the entities or their solutions
+    targets = await db_session.scalars(select(AdaptationTarget.target))
+    actual = [TargetBase.model_construct(type=target) for target in targets]
     return actual
 
 
@@ -36,6 +35,6 @@ async def create_target(db_session: AsyncSession, itarget: TargetBase):
         await db_session.commit()
         await db_session.refresh(db_target)
     except IntegrityError:
-        db_session.rollback()
+        await db_session.rollback()
         raise HTTPException(status_code=403, detail="Target already exists")
     return itarget
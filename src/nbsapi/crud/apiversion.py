@@ -1,3 +1,4 @@
+from cachetools import TTLCache
 from fastapi import HTTPException
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -5,11 +6,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from nbsapi.models.apiversion import ApiVersion as DbApiVersion
 from nbsapi.schemas.apiversion import ApiVersion as SchemaApiVersion
 
+VERSION_CACHE_TTL = 60
+
+# versions are only added by migrations, so there is nothing to invalidate from here
+_version_cache = TTLCache(maxsize=1, ttl=VERSION_CACHE_TTL)
+
 
 async def get_current_version(db_session: AsyncSession):
-    """Retrieve an individual adaptation target"""
+    """Retrieve the current API version, which only changes on deploy"""
+    actual = _version_cache.get("current")
+    if actual is not None:
+        return actual
     version = await db_session.scalar(select(func.max(DbApiVersion.version)))
     if not version:
         raise HTTPException(status_code=404, detail="Version not found")
-    actual = SchemaApiVersion(version=version)
+    actual = SchemaApiVersion.model_construct(version=version)
+    _version_cache["current"] = actual
     return actual
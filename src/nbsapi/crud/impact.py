@@ -9,32 +9,49 @@ from nbsapi.models.impact_unit import ImpactUnit as IIU
 from nbsapi.schemas.impact import ImpactBase, ImpactIntensity, ImpactUnit
 
 
-async def get_impacts(db_session: AsyncSession):
-    """Retrieve all available adaptation impacts"""
-    impacts = (await db_session.scalars(select(Impact))).unique()
+async def get_impacts(db_session: AsyncSession, offset: int = 0, limit: int = 100):
+    """Retrieve a page of adaptation impacts"""
+    rows = await db_session.execute(
+        select(Impact.magnitude, IIU.unit, IIU.description, IIM.intensity)
+        .join(Impact.unit)
+        .join(Impact.intensity)
+        .order_by(Impact.id)
+        .offset(offset)
+        .limit(limit)
+    )
     actual = [
-        ImpactBase(
-            magnitude=impact.magnitude, unit=impact.unit, intensity=impact.intensity
+        ImpactBase.model_construct(
+            magnitude=magnitude,
+            unit=ImpactUnit.model_construct(unit=unit, description=description),
+            intensity=ImpactIntensity.model_construct(intensity=intensity),
         )
-        for impact in impacts
+        for magnitude, unit, description, intensity in rows
     ]
     return actual
 
 
-async def get_impact_intensities(db_session: AsyncSession):
-    """Retrieve all available impact intensities"""
-    intensities = (await db_session.scalars(select(IIM))).unique()
+async def get_impact_intensities(
+    db_session: AsyncSession, offset: int = 0, limit: int = 100
+):
+    """Retrieve a page of impact intensities"""
+    intensities = await db_session.scalars(
+        select(IIM.intensity).order_by(IIM.id).offset(offset).limit(limit)
+    )
     actual = [
-        ImpactIntensity(intensity=intensity.intensity) for intensity in intensities
+        ImpactIntensity.model_construct(intensity=intensity)
+        for intensity in intensities
     ]
     return actual
 
 
-async def get_impact_units(db_session: AsyncSession):
-    """Retrieve all available impact units"""
-    units = (await db_session.scalars(select(IIU))).unique()
+async def get_impact_units(db_session: AsyncSession, offset: int = 0, limit: int = 100):
+    """Retrieve a page of impact units"""
+    units = await db_session.execute(
+        select(IIU.unit, IIU.description).order_by(IIU.id).offset(offset).limit(limit)
+    )
     actual = [
-        ImpactUnit(unit=unit.unit, description=unit.description) for unit in units
+        ImpactUnit.model_construct(unit=unit, description=description)
+        for unit, description in units
     ]
     return actual
 
@@ -51,7 +68,7 @@ async def create_impact_intensity(
         await db_session.commit()
         await db_session.refresh(db_target)
     except IntegrityError:
-        db_session.rollback()
+        await db_session.rollback()
         raise HTTPException(status_code=403, detail="Intensity already exists")
     return i_intensity
 
@@ -64,6 +81,6 @@ async def create_impact_unit(db_session: AsyncSession, i_unit: ImpactUnit):
         await db_session.commit()
         await db_session.refresh(db_target)
     except IntegrityError:
-        db_session.rollback()
+        await db_session.rollback()
         raise HTTPException(status_code=403, detail="Unit already exists")
     return i_unit
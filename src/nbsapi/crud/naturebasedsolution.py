@@ -3,10 +3,10 @@ from typing import List, Optional
 from fastapi import HTTPException
 from geoalchemy2 import Geography
 from geoalchemy2 import functions as geo_func
-from sqlalchemy import cast, select
+from sqlalchemy import cast, func, lambda_stmt, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased, joinedload
+from sqlalchemy.orm import joinedload, lazyload
 from sqlalchemy.sql import distinct
 
 from nbsapi.models import (
@@ -21,65 +21,60 @@ from nbsapi.models import (
     ImpactIntensity as ImpInt,
 )
 from nbsapi.models import NatureBasedSolution as NbsDBModel
-from nbsapi.schemas.adaptationtarget import TargetBase
 from nbsapi.schemas.impact import ImpactIntensity
 from nbsapi.schemas.naturebasedsolution import (
     AdaptationTargetRead,
     NatureBasedSolutionCreate,
     NatureBasedSolutionRead,
 )
+from nbsapi.utils.geo import AREA_TOLERANCE, bbox_area
 
 
 async def get_intersecting_geometries(
-    db_session: AsyncSession, bbox: Optional[List[float]]
+    db_session: AsyncSession, bbox: Optional[List[float]], index_only: bool = False
 ):
     MAX_BBOX_AREA = 1_000_000.0
     polygon_geom = geo_func.ST_MakeEnvelope(bbox[0], bbox[1], bbox[2], bbox[3], 4326)
-    geodesic_area = (
-        await db_session.execute(geo_func.ST_Area(cast(polygon_geom, Geography)))
-    ).scalar()
-    if geodesic_area > MAX_BBOX_AREA:
+    # the spherical area is within a percent of the geodesic one, so only ask PostGIS
+    # about boxes close enough to the limit for the difference to matter
+    area = bbox_area(*bbox) * 1_000_000  # sq m
+    if abs(area - MAX_BBOX_AREA) <= MAX_BBOX_AREA * AREA_TOLERANCE:
+        area = (
+            await db_session.execute(geo_func.ST_Area(cast(polygon_geom, Geography)))
+        ).scalar()
+    if area > MAX_BBOX_AREA:
         raise HTTPException(
             status_code=400,
             detail="GeoJSON input area exceeds the maximum limit of 1 square kilometer.",
         )
 
-    # Query to find intersecting geometries
-    query = select(NbsDBModel).where(
-        geo_func.ST_Intersects(NbsDBModel.geometry, polygon_geom)
-    )
+    # Query to find intersecting geometries: && is the GiST-indexed bounding-box
+    # filter, ST_Intersects then refines the surviving candidates
+    query = select(NbsDBModel).where(NbsDBModel.geometry.intersects(polygon_geom))
+    if not index_only:
+        query = query.where(geo_func.ST_Intersects(NbsDBModel.geometry, polygon_geom))
     return query
 
 
 async def build_nbs_schema_from_model(db_solution: NbsDBModel):
-    """FastAPI seems to struggle with automatic serialisation of the the db model to the schema
-    so we're doing it manually for now
+    """Read the eager-loaded solution, its targets, and its impacts straight from the ORM
+    objects, which pydantic-core does without a Python loop per field
     """
-    solution_read = NatureBasedSolutionRead(
-        id=db_solution.id,
-        name=db_solution.name,
-        definition=db_solution.definition,
-        cobenefits=db_solution.cobenefits,
-        specificdetails=db_solution.specificdetails,
-        location=db_solution.location,
-        adaptations=[
-            AdaptationTargetRead(
-                adaptation=TargetBase(id=assoc.tg.id, type=assoc.tg.target),
-                value=assoc.value,
-            )
-            for assoc in db_solution.solution_targets
-        ],
-        impacts=db_solution.impacts,
+    return NatureBasedSolutionRead.model_validate(db_solution)
+
+
+# built once: each call only binds a new solution ID
+_GET_SOLUTION = lambda_stmt(
+    lambda: select(NbsDBModel).options(
+        joinedload(NbsDBModel.solution_targets).joinedload(Association.tg)
     )
-    return solution_read
+)
 
 
 async def get_solution(db_session: AsyncSession, solution_id: int):
     solution = (
         await db_session.scalars(
-            select(NbsDBModel)
-            .options(joinedload(NbsDBModel.solution_targets).joinedload(Association.tg))
-            .where(NbsDBModel.id == solution_id)
+            _GET_SOLUTION + (lambda s: s.where(NbsDBModel.id == solution_id))
         )
     ).first()
     if not solution:
@@ -87,18 +82,51 @@ async def get_solution(db_session: AsyncSession, solution_id: int):
     return await build_nbs_schema_from_model(solution)
 
 
-def build_cte(target, assoc_alias, target_alias):
+async def get_solutions_by_id(db_session: AsyncSession, solution_ids: List[int]):
+    """
+    Retrieve several solutions using a single query, in the order they were requested
+
+    Unknown IDs are skipped
+    """
+    solutions = (
+        await db_session.scalars(
+            select(NbsDBModel)
+            .options(joinedload(NbsDBModel.solution_targets).joinedload(Association.tg))
+            .where(NbsDBModel.id.in_(solution_ids))
+        )
+    ).unique()
+    by_id = {solution.id: solution for solution in solutions}
+    return [
+        await build_nbs_schema_from_model(by_id[solution_id])
+        for solution_id in dict.fromkeys(solution_ids)
+        if solution_id in by_id
+    ]
+
+
+def build_target_filter(targets: List[AdaptationTargetRead]):
     """
-    Build an aliased CTE for Association and AdaptationTarget
+    Select the IDs of solutions meeting every target's minimum value, in a single pass
+
+    A type requested more than once must meet the highest of its values
     """
+    minimums = {}
+    for target in targets:
+        target_type = target.adaptation.type
+        minimums[target_type] = max(minimums.get(target_type, target.value), target.value)
     return (
-        select(distinct(assoc_alias.nbs_id).label("nbs_id"))
-        .join(target_alias, assoc_alias.target_id == target_alias.id)
+        select(Association.nbs_id)
+        .join(AdaptationTarget, Association.target_id == AdaptationTarget.id)
         .where(
-            (target_alias.target == target.adaptation.type)
-            & (assoc_alias.value >= target.value)
+            or_(
+                *(
+                    (AdaptationTarget.target == target_type)
+                    & (Association.value >= value)
+                    for target_type, value in minimums.items()
+                )
+            )
         )
-        .cte()
+        .group_by(Association.nbs_id)
+        .having(func.count(distinct(AdaptationTarget.id)) == len(minimums))
     )
 
 
@@ -107,33 +135,44 @@ async def get_filtered_solutions(
     targets: Optional[List[AdaptationTargetRead]],
     bbox: Optional[List[float]],
     intensities: Optional[List[ImpactIntensity]],
+    index_only: bool = False,
+    limit: int = 100,
+    offset: int = 0,
 ):
     query = select(NbsDBModel)
     if bbox:
-        query = await get_intersecting_geometries(db_session, bbox)
+        query = await get_intersecting_geometries(db_session, bbox, index_only)
     if targets:
-        # generate CTEs for each Target and adaptation value in the incoming API query
-        condition_sets = [
-            build_cte(target, aliased(Association), aliased(AdaptationTarget))
-            for target in targets
-        ]
-
-        for cset in condition_sets:
-            # dynamically add WHERE clauses from the generated CTEs
-            query = query.where(NbsDBModel.id.in_(select(cset.c.nbs_id)))
+        query = query.where(NbsDBModel.id.in_(build_target_filter(targets)))
     if intensities:
-        # join solution -> intensity -> impact
-        query = query.join(Imp)
-        query = query.join(Imp.intensity)
+        # solutions having an impact of any of the given intensities. A subquery rather
+        # than a join, so that each solution is a single row and LIMIT counts solutions
         query = query.where(
-            ImpInt.intensity.in_(impact.intensity for impact in intensities)
+            NbsDBModel.id.in_(
+                select(Imp.solution_id)
+                .join(Imp.intensity)
+                .where(ImpInt.intensity.in_(impact.intensity for impact in intensities))
+            )
         )
+    query = query.order_by(NbsDBModel.id).limit(limit).offset(offset)
     res = (await db_session.scalars(query)).unique()
     if res:
         res = [await build_nbs_schema_from_model(model) for model in res]
     return res
 
 
+async def _rows_by(db_session: AsyncSession, column, values, *options):
+    """
+    Retrieve the rows whose `column` is one of `values` in one query, keyed by that column
+    """
+    if not values:
+        return {}
+    rows = await db_session.scalars(
+        select(column.class_).options(*options).where(column.in_(values))
+    )
+    return {getattr(row, column.key): row for row in rows}
+
+
 async def create_nature_based_solution(
     db_session: AsyncSession, solution: NatureBasedSolutionCreate
 ):
@@ -145,39 +184,38 @@ async def create_nature_based_solution(
             specificdetails=solution.specificdetails,
             location=solution.location,
         )
+        # resolve every referenced target, intensity and unit up front, one query each
+        targets = await _rows_by(
+            db_session,
+            AdaptationTarget.target,
+            {adaptation.adaptation.type for adaptation in solution.adaptations},
+            lazyload(AdaptationTarget.solutions),
+        )
+        intensities = await _rows_by(
+            db_session,
+            ImpInt.intensity,
+            {impact.intensity.intensity for impact in solution.impacts},
+        )
+        units = await _rows_by(
+            db_session, ImpactUnit.unit, {impact.unit.unit for impact in solution.impacts}
+        )
         for adaptation in solution.adaptations:
             target_type = adaptation.adaptation.type
-            value = adaptation.value
-            # Properly execute the select statement
-            result = await db_session.execute(
-                select(AdaptationTarget).where(AdaptationTarget.target == target_type)
-            )
-            target = result.scalars().first()
+            target = targets.get(target_type)
             if not target:
                 raise HTTPException(
                     status_code=404,
                     detail=f"AdaptationTarget {target_type} not found",
                 )
-            association = Association(tg=target, value=value)
+            association = Association(tg=target, value=adaptation.value)
             db_solution.solution_targets.append(association)
             db_session.add(association)
         for impact in solution.impacts:
-            magnitude = impact.magnitude
-            intensity = impact.intensity
-            unit = impact.unit
-            db_intensity = await db_session.execute(
-                select(ImpactIntensity).where(
-                    ImpactIntensity.intensity == intensity.intensity
-                )
-            )
-            intensity_res = db_intensity.unique().scalar_one_or_none()
-            db_unit = await db_session.execute(
-                select(ImpactUnit).where(ImpactUnit.unit == unit.unit)
-            )
-            unit_res = db_unit.unique().scalar_one_or_none()
+            intensity_res = intensities.get(impact.intensity.intensity)
+            unit_res = units.get(impact.unit.unit)
             if intensity_res and unit_res:
-                db_impact = Impact(
-                    magnitude=magnitude,
+                db_impact = Imp(
+                    magnitude=impact.magnitude,
                     unit=unit_res,
                     intensity=intensity_res,
                     solution=db_solution,
@@ -192,7 +230,7 @@ async def create_nature_based_solution(
         await db_session.commit()
         await db_session.refresh(db_solution)
     except IntegrityError:
-        db_session.rollback()
+        await db_session.rollback()
         raise HTTPException(
             status_code=403,
             detail=f"Solution '{solution.name}' already exists",
@@ -1,5 +1,6 @@
 from fastapi import HTTPException
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from nbsapi.models import User as UserDBModel
@@ -25,11 +26,11 @@ async def get_user_by_username(db_session: AsyncSession, username: str):
 
 
 async def make_user(db_session: AsyncSession, newuser: UserWrite):
-    db_user = (
-        await db_session.scalars(
-            select(UserDBModel).where(UserDBModel.username == newuser.username)
+    # let the unique constraints catch duplicates, rather than checking first
+    try:
+        return await create_user(db_session=db_session, user=newuser)
+    except IntegrityError:
+        await db_session.rollback()
+        raise HTTPException(
+            status_code=400, detail="Username or email already registered"
         )
-    ).first()
-    if db_user:
-        raise HTTPException(status_code=400, detail="Username already registered")
-    return await create_user(db_session=db_session, user=newuser)
@@ -82,7 +82,15 @@ class DatabaseSessionManager:
 
 
 sessionmanager = DatabaseSessionManager(
-    inject_driver(settings.database_url), {"echo": settings.echo_sql}
+    inject_driver(settings.database_url),
+    {
+        "echo": settings.echo_sql,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    },
 )
 
 
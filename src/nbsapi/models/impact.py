@@ -18,7 +18,7 @@ class Impact(Base):
     unit_id: Mapped[int] = mapped_column(ForeignKey("impact_unit.id"))
     unit: Mapped["ImpactUnit"] = relationship(back_populates="impacts", lazy="joined")
     solution_id: Mapped[int] = mapped_column(
-        ForeignKey("naturebasedsolution.id"), nullable=False
+        ForeignKey("naturebasedsolution.id"), nullable=False, index=True
     )
     solution: Mapped["NatureBasedSolution"] = relationship(
         back_populates="impacts",
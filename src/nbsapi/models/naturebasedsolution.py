@@ -35,8 +35,12 @@ class NatureBasedSolution(Base):
     cobenefits: Mapped[str] = mapped_column(index=True)
     specificdetails: Mapped[str] = mapped_column(index=True)
     location: Mapped[str] = mapped_column(index=True)
+    # only ever used to filter, so don't fetch it with every solution
     geometry: Mapped[WKBElement] = mapped_column(
-        Geometry("GEOMETRY", srid=4326), spatial_index=True, nullable=True
+        Geometry("GEOMETRY", srid=4326),
+        spatial_index=True,
+        nullable=True,
+        deferred=True,
     )
 
     solution_targets = relationship(
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 from typing_extensions import Annotated
 
 
@@ -12,7 +12,8 @@ class TargetBase(BaseModel):
         },
     )
 
-    type: str
+    # ORM targets store the name as `target`
+    type: str = Field(validation_alias=AliasChoices("type", "target"))
 
 
 class AdaptationTargetRead(BaseModel):
@@ -23,5 +24,6 @@ class AdaptationTargetRead(BaseModel):
         from_attributes=True,
     )
 
-    adaptation: TargetBase
+    # ORM associations hold the target as `tg`
+    adaptation: TargetBase = Field(validation_alias=AliasChoices("adaptation", "tg"))
     value: Annotated[int, Field(ge=0, le=100)]
@@ -25,6 +25,14 @@ class User(BaseModel):
     disabled: bool = Field(False, examples=[False])
 
 
+class AuthenticatedUser(User):
+    """A read-only snapshot of the user behind a token, which requests may share"""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: int
+
+
 class UserWrite(User):
     password: str = Field(None, examples=[gen_example_password()])
 
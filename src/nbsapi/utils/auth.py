@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
 import jwt
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 from sqlalchemy import select
@@ -27,7 +28,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 async def create_user(db_session: AsyncSession, user: UserWrite):
-    hashed_password = get_password_hash(user.password)
+    # bcrypt is deliberately slow, so keep it off the event loop
+    hashed_password = await run_in_threadpool(get_password_hash, user.password)
     db_user = User(
         username=user.username,
         first_name=user.first_name,
@@ -49,7 +51,7 @@ async def is_authenticated(db_session: AsyncSession, username: str, password: st
 
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    if not await run_in_threadpool(verify_password, password, user.hashed_password):
         return False
     return user
 
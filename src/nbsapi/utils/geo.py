@@ -0,0 +1,21 @@
+from math import radians, sin
+
+# Mean radius of the Earth (IUGG), in km
+EARTH_RADIUS = 6371.0088
+# how far bbox_area may stray from PostGIS's geodesic area on the WGS84 ellipsoid
+AREA_TOLERANCE = 0.01
+
+
+def bbox_area(west: float, south: float, east: float, north: float) -> float:
+    """
+    Calculate the area of a [west, south, east, north] bounding box in sq km
+
+    This is the exact area of the box on a sphere, which stays within 1% of PostGIS's
+    geodesic area on the WGS84 ellipsoid
+
+    """
+    return (
+        EARTH_RADIUS**2
+        * abs(sin(radians(north)) - sin(radians(south)))
+        * abs(radians(east - west))
+    )
@@ -1,13 +1,178 @@
+import asyncio
 import json
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 
+from nbsapi.api.v1.routers import impacts, naturebasedsolutions
+from nbsapi.api.v1.routers.impacts import etag_matches
+from nbsapi.api.v1.routers.naturebasedsolutions import SolutionRequest
+from nbsapi.crud.adaptationtarget import create_target
+from nbsapi.crud import naturebasedsolution
+from nbsapi.crud.impact import create_impact_intensity, create_impact_unit
+from nbsapi.crud.naturebasedsolution import (
+    build_target_filter,
+    create_nature_based_solution,
+)
+from nbsapi.database import get_db_session
 from nbsapi.main import app
+from nbsapi.models.adaptation_target import AdaptationTarget
+from nbsapi.models.apiversion import ApiVersion as DbApiVersion
+from nbsapi.schemas.adaptationtarget import AdaptationTargetRead, TargetBase
+from nbsapi.schemas.apiversion import ApiVersion
+from nbsapi.schemas.impact import ImpactIntensity, ImpactUnit
+from nbsapi.schemas.naturebasedsolution import NatureBasedSolutionCreate
 
 client = TestClient(app)
 
 
+@pytest.fixture
+def no_db():
+    """Serve requests without a database, for tests that patch out the CRUD calls"""
+
+    async def no_db_session():
+        yield None
+
+    app.dependency_overrides[get_db_session] = no_db_session
+    yield
+    app.dependency_overrides.clear()
+
+
 def test_nbsapi():
     t = True
     assert t, True
+
+
+def test_impact_intensities_etag(no_db):
+    impacts._lookup_cache.clear()
+    with patch.object(
+        impacts, "get_impact_intensities", return_value=[ImpactIntensity(intensity="low")]
+    ) as lookup:
+        first = client.get("/v1/api/impacts/impact_intensities")
+        etag = first.headers["etag"]
+        second = client.get(
+            "/v1/api/impacts/impact_intensities", headers={"If-None-Match": etag}
+        )
+    assert first.status_code == 200
+    assert json.loads(first.content) == [{"intensity": "low"}]
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert first.headers["cache-control"] == "no-cache"
+    assert lookup.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "if_none_match, matches",
+    [
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", W/"abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+        ("", False),
+    ],
+)
+def test_etag_matches(if_none_match, matches):
+    assert etag_matches(if_none_match, '"abc"') is matches
+
+
+def test_constructed_schemas_match_column_types():
+    """CRUD builds these schemas with model_construct, which doesn't coerce values"""
+    pairs = [
+        (AdaptationTarget.target, TargetBase.model_fields["type"]),
+        (DbApiVersion.version, ApiVersion.model_fields["version"]),
+    ]
+    for column, field in pairs:
+        assert column.type.python_type is field.annotation
+
+
+def failing_commit_session():
+    """A session whose commit fails as if a unique constraint was violated"""
+    db_session = AsyncMock(add=MagicMock())
+    db_session.commit.side_effect = IntegrityError("INSERT", {}, Exception())
+    return db_session
+
+
+@pytest.mark.parametrize(
+    "create, payload",
+    [
+        (create_target, TargetBase(type="Heat")),
+        (create_impact_intensity, ImpactIntensity(intensity="low")),
+        (create_impact_unit, ImpactUnit(unit="m2", description="shade")),
+        (
+            create_nature_based_solution,
+            NatureBasedSolutionCreate(
+                name="Riprap",
+                definition="Definition",
+                cobenefits="Cobenefits",
+                specificdetails="Details",
+                location="Location",
+            ),
+        ),
+    ],
+)
+def test_duplicate_rolls_back(create, payload):
+    db_session = failing_commit_session()
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(create(db_session, payload))
+    assert e.value.status_code == 403
+    db_session.rollback.assert_awaited_once()
+
+
+def test_bbox_area_check_defers_to_postgis_near_the_limit():
+    # ~0.997 sq km on the WGS84 ellipsoid, but ~1.0015 sq km on the sphere
+    near_limit = [0.0, 0.0, 0.009, 0.009]
+    assert SolutionRequest(bbox=near_limit).bbox == tuple(near_limit)
+    with pytest.raises(ValidationError):
+        SolutionRequest(bbox=[0.0, 0.0, 0.1, 0.1])
+
+
+def test_solutions_by_id_keep_request_order():
+    db_session = AsyncMock()
+    db_session.scalars.return_value.unique = MagicMock(
+        return_value=[SimpleNamespace(id=1), SimpleNamespace(id=3)]
+    )
+    with patch.object(
+        naturebasedsolution,
+        "build_nbs_schema_from_model",
+        AsyncMock(side_effect=lambda solution: solution.id),
+    ):
+        solutions = asyncio.run(
+            naturebasedsolution.get_solutions_by_id(db_session, [3, 2, 1, 3])
+        )
+    # duplicates are collapsed and the unknown ID 2 is skipped
+    assert solutions == [3, 1]
+    db_session.scalars.assert_awaited_once()
+
+
+@pytest.mark.parametrize("solution_ids", [[], list(range(101))])
+def test_solutions_batch_size_is_bounded(no_db, solution_ids):
+    with patch.object(naturebasedsolutions, "get_solutions_by_id") as lookup:
+        response = client.post("/v1/api/solutions/solutions/batch", json=solution_ids)
+    assert response.status_code == 422
+    lookup.assert_not_called()
+
+
+def test_target_filter_requires_every_type():
+    targets = [
+        AdaptationTargetRead.model_validate(
+            {"adaptation": {"type": target_type}, "value": value}
+        )
+        for target_type, value in [("Heat", 10), ("Flooding", 20), ("Heat", 40)]
+    ]
+    compiled = build_target_filter(targets).compile(dialect=postgresql.dialect())
+    assert "count(DISTINCT adaptationtarget.id) = %(count_1)s" in str(compiled)
+    # two distinct types, and the repeated Heat keeps only its highest value
+    assert compiled.params == {
+        "target_1": "Heat",
+        "value_1": 40,
+        "target_2": "Flooding",
+        "value_2": 20,
+        "count_1": 2,
+    }